@@ -8,12 +8,30 @@ support.
 
 __version__ = "0.1.0"
 
-from .converters.json_to_qmd import convert_json_to_qmd
-from .converters.json_to_md import convert_json_to_markdown
-from .bib.regenerate_keys import regenerate_bib_keys
-
 __all__ = [
     "convert_json_to_qmd",
     "convert_json_to_markdown",
     "regenerate_bib_keys",
 ]
+
+# Public names and the submodules providing them. They are imported on first
+# access (PEP 562) so a CLI command only loads the converter it uses.
+_LAZY_IMPORTS = {
+    "convert_json_to_qmd": ".converters.json_to_qmd",
+    "convert_json_to_markdown": ".converters.json_to_md",
+    "regenerate_bib_keys": ".bib.regenerate_keys",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -4,12 +4,13 @@ FirstAuthorLastNameYearFirstThreeSubstantialTitleWords
 
 Example: Yancosek2024BeaconBayesianEvolutionary
 """
+import functools
 import re
 import os
 
 
 # Common words to skip in titles
-SKIP_WORDS = {
+SKIP_WORDS = frozenset({
     'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
     'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
@@ -17,19 +18,46 @@ SKIP_WORDS = {
     'through', 'into', 'onto', 'upon', 'about', 'over', 'under', 'between',
     'among', 'during', 'before', 'after', 'above', 'below', 'this', 'that',
     'these', 'those', 'our', 'their', 'its', 'his', 'her'
-}
-
-
+})
+
+# Precompiled patterns used for every entry
+_RE_BRACES = re.compile(r'[{}]')
+_RE_AND = re.compile(r'\s+and\s+', re.IGNORECASE)
+_RE_NONWORD = re.compile(r'[^\w]')
+_RE_YEAR = re.compile(r'\d{4}')
+_RE_WORDS = re.compile(r'\b[a-zA-Z]+\b')
+
+# Translation tables for stripping fixed character sets
+_BRACE_TBL = str.maketrans('', '', '{}')
+_TITLE_TBL = str.maketrans('', '', '{}"\'`')
+
+# Token patterns for the BibTeX scanner; each is matched at the scanner's
+# current position so only one token is consumed per step
+_RE_ENTRY_START = re.compile(r'@([\w\-:]+)\s*\{')
+_RE_FIELD_HEAD = re.compile(r'[\s,]*([\w\-:]+)\s*=\s*')
+_RE_ENTRY_CLOSE = re.compile(r'[\s,]*\}')
+_RE_BARE_VALUE = re.compile(r'[^,}#\s]+')
+_RE_CONCAT = re.compile(r'\s*#\s*')
+_RE_QUOTED_STOP = re.compile(r'[{}"]')
+# An '@' starting a line; an entry never reads past the next one, so an
+# unclosed brace or quote only damages its own entry
+_RE_LINE_ENTRY = re.compile(r'\n[ \t]*@')
+
+# Entry types that carry no citation key; passed through untouched
+_KEYLESS_TYPES = frozenset({'comment', 'preamble', 'string'})
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_author_lastname(author_field):
     """Extract the last name of the first author"""
     if not author_field:
         return "Unknown"
 
     # Remove braces and extra whitespace
-    author_field = re.sub(r'[{}]', '', author_field).strip()
+    author_field = author_field.translate(_BRACE_TBL).strip()
 
     # Split by 'and' to get first author
-    authors = re.split(r'\s+and\s+', author_field, flags=re.IGNORECASE)
+    authors = _RE_AND.split(author_field)
     first_author = authors[0].strip()
 
     # Handle different formats:
@@ -43,37 +71,44 @@ def extract_author_lastname(author_field):
         lastname = parts[-1].strip()
 
     # Remove any remaining special characters and capitalize
-    lastname = re.sub(r'[^\w]', '', lastname)
+    lastname = _RE_NONWORD.sub('', lastname)
+    if lastname[:1].isupper() and lastname[1:].islower():
+        # Already capitalized (the usual case); avoid a new string
+        return lastname
     return lastname.capitalize()
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_year(year_field):
     """Extract year from year field"""
     if not year_field:
         return "NoYear"
 
     # Extract 4-digit year
-    match = re.search(r'\d{4}', year_field)
+    match = _RE_YEAR.search(year_field)
     if match:
         return match.group(0)
 
     return "NoYear"
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_title_words(title_field, n_words=3):
     """Extract first N substantial words from title"""
     if not title_field:
         return "NoTitle"
 
     # Remove braces, quotes, and other special characters
-    title = re.sub(r'[{}"\'`]', '', title_field)
+    title = title_field.translate(_TITLE_TBL)
 
-    # Split into words
-    words = re.findall(r'\b[a-zA-Z]+\b', title)
-
-    # Filter out skip words and short words, capitalize first letter
+    # Filter out skip words and short words, capitalize first letter.
+    # Words are matched lazily so long titles stop after n_words hits.
     substantial_words = []
-    for word in words:
+    first_words = []
+    for match in _RE_WORDS.finditer(title):
+        word = match.group()
+        if len(first_words) < n_words:
+            first_words.append(word)
         if len(word) > 2 and word.lower() not in SKIP_WORDS:
             substantial_words.append(word.capitalize())
             if len(substantial_words) >= n_words:
@@ -81,7 +116,7 @@ def extract_title_words(title_field, n_words=3):
 
     if not substantial_words:
         # If no substantial words found, use first few words regardless
-        substantial_words = [w.capitalize() for w in words[:n_words]]
+        substantial_words = [w.capitalize() for w in first_words]
 
     return ''.join(substantial_words[:n_words])
 
@@ -95,82 +130,237 @@ def generate_citation_key(entry_type, fields):
     return f"{author}{year}{title_words}"
 
 
-def parse_bib_entry(entry_text):
-    """Parse a single BibTeX entry into components"""
-    # Extract entry type and old key
-    match = re.match(r'@(\w+)\s*\{\s*([^,]+)\s*,', entry_text)
+def _match_brace(content, i, limit):
+    """Return the index just past the '}' matching the '{' at i, or -1"""
+    # Fast path: most values have no nested braces before the first '}'
+    close = content.find('}', i + 1, limit)
+    if close < 0:
+        return -1
+    if content.find('{', i + 1, close) < 0:
+        return close + 1
+
+    depth = 0
+    match = _RE_BRACES.search(content, i, limit)
+    while match:
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        match = _RE_BRACES.search(content, match.end(), limit)
+    return -1
+
+
+def _read_value(content, i, limit):
+    """
+    Read one field value ({...}, "..." or a bare word) starting at i,
+    without reading at or past limit.
+
+    Returns:
+        Tuple of (value, end_index), or (None, i) if no value could be read
+    """
+    c = content[i:i + 1] if i < limit else ''
+    if c == '{':
+        end = _match_brace(content, i, limit)
+        if end < 0:
+            return None, i
+        return content[i + 1:end - 1], end
+
+    if c == '"':
+        # Fast path: no braces before the closing quote
+        close = content.find('"', i + 1, limit)
+        if close >= 0 and content.find('{', i + 1, close) < 0:
+            return content[i + 1:close], close + 1
+
+        # Quotes nested inside braces do not terminate the value
+        depth = 0
+        match = _RE_QUOTED_STOP.search(content, i + 1, limit)
+        while match:
+            ch = match.group()
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+            elif depth <= 0:
+                return content[i + 1:match.start()], match.end()
+            match = _RE_QUOTED_STOP.search(content, match.end(), limit)
+        return None, i
+
+    # Bare number or @string macro
+    match = _RE_BARE_VALUE.match(content, i, limit)
     if not match:
-        return None
+        return None, i
+    return match.group(), match.end()
 
-    entry_type = match.group(1)
-    old_key = match.group(2).strip()
 
-    # Extract all fields
-    fields = {}
-    field_pattern = r'(\w+)\s*=\s*[{"]([^}"]*)["}\s]*'
-    for field_match in re.finditer(field_pattern, entry_text):
-        field_name = field_match.group(1).lower()
-        field_value = field_match.group(2)
-        fields[field_name] = field_value
+def _scan_entry(content, brace, limit):
+    """
+    Scan the body of an entry whose opening '{' is at index brace.
+
+    Returns:
+        Tuple of (key, key_start, fields, end) where end is just past the
+        closing '}', or None if the entry is malformed or does not close
+        before limit
+    """
+    comma = content.find(',', brace + 1, limit)
+    if comma < 0:
+        return None
+    raw_key = content[brace + 1:comma]
+    key = raw_key.strip()
+    if not key or '{' in key or '}' in key:
+        return None
+    key_start = brace + 1 + (len(raw_key) - len(raw_key.lstrip()))
 
-    return {
-        'type': entry_type,
-        'old_key': old_key,
-        'fields': fields,
-        'full_text': entry_text
-    }
+    fields = {}
+    i = comma + 1
+    while True:
+        head = _RE_FIELD_HEAD.match(content, i, limit)
+        if not head:
+            close = _RE_ENTRY_CLOSE.match(content, i, limit)
+            if not close:
+                return None
+            return key, key_start, fields, close.end()
+
+        # field = value [# value ...]
+        i = head.end()
+        parts = []
+        while True:
+            value, i = _read_value(content, i, limit)
+            if value is None:
+                return None
+            parts.append(value)
+            concat = _RE_CONCAT.match(content, i, limit)
+            if not concat:
+                break
+            i = concat.end()
+        fields[head.group(1).lower()] = ''.join(parts)
 
 
-def regenerate_bib_keys(bib_content):
+def _scan_bib(content):
     """
-    Regenerate all citation keys in bib file content
+    Scan BibTeX content in one left-to-right pass.
+
+    Nested braces in field values are tracked, so titles such as
+    "{B}ayesian {M}odels" are read whole. @comment, @preamble and @string
+    blocks and malformed entries are not yielded, leaving that text to the
+    caller. No entry is read past the next line starting with '@', which
+    keeps the cost of an unclosed brace or quote local to its entry.
+
+    Yields:
+        Tuples of (entry_type, key, fields, start, end, key_start) where
+        content[start:end] is the full entry text and the key begins at
+        content[key_start]
+    """
+    i = 0
+    limit = -1
+    while True:
+        head = _RE_ENTRY_START.search(content, i)
+        if not head:
+            return
+        start = head.start()
+        entry_type = head.group(1)
+        brace = head.end() - 1
+        i = start + 1
+
+        # Entries sharing a line share a boundary; only search again once
+        # it has been passed, so one-line files stay linear
+        if head.end() > limit:
+            boundary = _RE_LINE_ENTRY.search(content, head.end())
+            limit = boundary.start() if boundary else len(content)
+
+        if entry_type.lower() in _KEYLESS_TYPES:
+            end = _match_brace(content, brace, limit)
+            if end > 0:
+                i = end
+            continue
 
-    Args:
-        bib_content: String content of .bib file
+        scanned = _scan_entry(content, brace, limit)
+        if scanned is None:
+            continue
+        key, key_start, fields, end = scanned
+        yield entry_type, key, fields, start, end, key_start
+        i = end
 
-    Returns:
-        Tuple of (new_content, key_mapping) where key_mapping is dict of old_key -> new_key
+
+def parse_bib_entry(entry_text):
+    """Parse a single BibTeX entry into components"""
+    for entry_type, old_key, fields, start, end, _ in _scan_bib(entry_text):
+        return {
+            'type': entry_type,
+            'old_key': old_key,
+            'fields': fields,
+            'full_text': entry_text[start:end]
+        }
+    return None
+
+
+def iter_regenerated_bib(bib_content, key_mapping=None):
     """
-    # Split into entries
-    entries = re.split(r'(?=@\w+\s*\{)', bib_content)
+    Yield regenerated bib file content piece by piece
 
-    new_content = ""
-    key_mapping = {}  # old_key -> new_key
+    Lets callers stream the rewritten file to disk without building the
+    whole new content in memory.
 
-    for entry in entries:
-        entry = entry.strip()
-        if not entry or not entry.startswith('@'):
-            # Keep preamble or comments
-            if entry:
-                new_content += entry + "\n\n"
-            continue
+    Args:
+        bib_content: String content of .bib file
+        key_mapping: Optional dict that is filled with old_key -> new_key
+            as entries are processed
 
-        parsed = parse_bib_entry(entry)
-        if not parsed:
-            # Keep unparseable entries as-is
-            new_content += entry + "\n\n"
-            continue
+    Yields:
+        Consecutive string fragments of the new content
+    """
+    if key_mapping is None:
+        key_mapping = {}
+    used_keys = set()  # new keys already assigned, for O(1) duplicate checks
+    next_suffix = {}  # base key -> next suffix to try, so probing resumes
+    pos = 0
+
+    for entry_type, old_key, fields, start, end, key_start in _scan_bib(bib_content):
+        # Keep preamble, comments and unparseable text between entries
+        between = bib_content[pos:start].strip()
+        if between:
+            yield between + "\n\n"
+        pos = end
 
         # Generate new key
-        new_key = generate_citation_key(parsed['type'], parsed['fields'])
+        new_key = generate_citation_key(entry_type, fields)
 
         # Handle duplicate keys by adding a suffix
         base_key = new_key
-        suffix = 1
-        while new_key in key_mapping.values():
+        if new_key in used_keys:
+            suffix = next_suffix.get(base_key, 1)
             new_key = f"{base_key}_{suffix}"
-            suffix += 1
+            while new_key in used_keys:
+                suffix += 1
+                new_key = f"{base_key}_{suffix}"
+            next_suffix[base_key] = suffix + 1
+        used_keys.add(new_key)
 
         # Store mapping
-        key_mapping[parsed['old_key']] = new_key
+        key_mapping[old_key] = new_key
 
-        # Replace old key with new key in entry text
-        new_entry = re.sub(
-            r'(@\w+\s*\{\s*)' + re.escape(parsed['old_key']),
-            r'\1' + new_key,
-            parsed['full_text']
-        )
+        # Splice the new key in place of the old one
+        yield bib_content[start:key_start]
+        yield new_key
+        yield bib_content[key_start + len(old_key):end]
+        yield "\n\n"
 
-        new_content += new_entry + "\n\n"
+    trailing = bib_content[pos:].strip()
+    if trailing:
+        yield trailing + "\n\n"
 
+
+def regenerate_bib_keys(bib_content):
+    """
+    Regenerate all citation keys in bib file content
+
+    Args:
+        bib_content: String content of .bib file
+
+    Returns:
+        Tuple of (new_content, key_mapping) where key_mapping is dict of old_key -> new_key
+    """
+    key_mapping = {}  # old_key -> new_key
+    new_content = "".join(iter_regenerated_bib(bib_content, key_mapping))
     return new_content, key_mapping
@@ -2,16 +2,55 @@
 Command-line interface for ASTRA tools
 """
 import argparse
+import contextlib
 import sys
 import os
 
-from .converters.json_to_qmd import convert_json_to_qmd, check_bib_file
-from .converters.json_to_md import convert_json_to_markdown
-from .bib.regenerate_keys import regenerate_bib_keys
+# Buffer size for writing converted output; large reports and bibliographies
+# are written with far fewer syscalls than with the 8 KiB default
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _atomic_output(path):
+    """
+    Open path for writing through a temporary file in the same directory
+
+    Output is streamed, so the temporary file only replaces path once the
+    block completes; an error partway through leaves any existing file
+    untouched and no partial output behind. A symlinked path is written
+    through to its target, as a plain open() would.
+    """
+    import tempfile
+
+    path = os.path.realpath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp'
+    )
+    try:
+        with open(fd, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+        if os.path.exists(path):
+            # Keep the permissions of the file being replaced
+            import shutil
+            shutil.copymode(path, tmp_path)
+        else:
+            # mkstemp creates files as 0600; use the mode open() would give
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
 
 def cmd_json_to_qmd(args):
     """Convert JSON to Quarto markdown (.qmd)"""
+    # Converters are imported per command to keep CLI startup fast
+    from .converters.json_to_qmd import convert_json_to_qmd, check_bib_file
+
     json_file = args.json_file
 
     if not os.path.exists(json_file):
@@ -45,7 +84,7 @@ def cmd_json_to_qmd(args):
         )
 
         # Write markdown file
-        with open(qmd_file, 'w', encoding='utf-8') as f:
+        with open(qmd_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
             f.write(markdown_content)
 
         print(f"✅ Successfully converted to {os.path.basename(qmd_file)}")
@@ -71,6 +110,8 @@ def cmd_json_to_qmd(args):
 
 def cmd_json_to_md(args):
     """Convert JSON to markdown (.md)"""
+    from .converters.json_to_md import convert_json_to_markdown, get_markdown_path
+
     json_file = args.json_file
 
     if not os.path.exists(json_file):
@@ -79,11 +120,12 @@ def cmd_json_to_md(args):
 
     try:
         print(f"📄 Converting {os.path.basename(json_file)} to markdown...")
-        markdown_content, markdown_file = convert_json_to_markdown(json_file)
+        markdown_file = get_markdown_path(json_file)
 
-        # Write markdown file
-        with open(markdown_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # Stream markdown into the output file; a report that fails to
+        # parse or convert leaves any existing .md untouched
+        with _atomic_output(markdown_file) as f:
+            convert_json_to_markdown(json_file, out=f)
 
         print(f"✅ Successfully converted to {os.path.basename(markdown_file)}")
         return 0
@@ -98,6 +140,8 @@ def cmd_json_to_md(args):
 
 def cmd_regenerate_bib(args):
     """Regenerate citation keys in .bib file"""
+    from .bib.regenerate_keys import iter_regenerated_bib
+
     bib_file = args.bib_file
 
     if not os.path.exists(bib_file):
@@ -111,8 +155,25 @@ def cmd_regenerate_bib(args):
 
         print(f"📖 Reading {os.path.basename(bib_file)}...")
 
-        # Regenerate keys
-        new_content, key_mapping = regenerate_bib_keys(original_content)
+        # Regenerate keys, streaming the new content straight to disk
+        key_mapping = {}
+        new_parts = iter_regenerated_bib(original_content, key_mapping)
+
+        if args.inplace:
+            backup_file = bib_file + '.backup'
+            output_file = bib_file
+        else:
+            # Create new file
+            output_file = os.path.splitext(bib_file)[0] + '.new.bib'
+
+        # Nothing is replaced unless every entry was regenerated
+        with _atomic_output(output_file) as f:
+            f.writelines(new_parts)
+
+            if args.inplace:
+                # Backup original before overwriting it
+                with open(backup_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as backup:
+                    backup.write(original_content)
 
         print(f"✅ Regenerated {len(key_mapping)} citation keys")
 
@@ -123,24 +184,11 @@ def cmd_regenerate_bib(args):
                 if old_key != new_key:
                     print(f"   {old_key:30} -> {new_key}")
 
-        # Write output
+        # Report output
         if args.inplace:
-            # Backup original
-            backup_file = bib_file + '.backup'
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                f.write(original_content)
             print(f"\n💾 Backed up original to {os.path.basename(backup_file)}")
-
-            # Write new content
-            with open(bib_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
             print(f"✅ Updated {os.path.basename(bib_file)} in place")
-
         else:
-            # Create new file
-            output_file = os.path.splitext(bib_file)[0] + '.new.bib'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
             print(f"\n✅ Created new file: {os.path.basename(output_file)}")
             print(f"   Review and rename to replace original if satisfied")
 
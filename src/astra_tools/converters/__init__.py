@@ -1,6 +1,25 @@
 """Converters for ASTRA JSON artifacts to various formats."""
 
-from .json_to_qmd import convert_json_to_qmd
-from .json_to_md import convert_json_to_markdown
+__all__ = ["convert_json_to_qmd", "convert_json_to_markdown", "convert_many"]
 
-__all__ = ["convert_json_to_qmd", "convert_json_to_markdown"]
+# Imported on first access (PEP 562) so loading one converter does not
+# pull in the other
+_LAZY_IMPORTS = {
+    "convert_json_to_qmd": ".json_to_qmd",
+    "convert_json_to_markdown": ".json_to_md",
+    "convert_many": ".json_to_qmd",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
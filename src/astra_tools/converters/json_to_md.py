@@ -1,56 +1,97 @@
 """
 Convert JSON artifact to markdown format with inline citations and references
 """
-import json
 import os
 import re
+try:
+    # Optional faster JSON parser
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+# Maximum snippet length shown in the references section
+SNIPPET_MAX = 500
+
+# Reports with more sections and more total text than this are cleaned in
+# worker processes; below it, process startup outweighs the regex work
+PARALLEL_MIN_SECTIONS = 4
+PARALLEL_MIN_CHARS = 4_000_000
+
+# Precompiled patterns applied to every section
+_RE_PAPER = re.compile(r'<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>')
+_RE_MODEL = re.compile(r'<Model[^>]*>\.?</Model>')
+# Model tags and Paper tags in one alternation; group 1 is empty for Model tags
+_RE_TAGS = re.compile(
+    r'<Model[^>]*>\.?</Model>|<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>'
+)
 
 
 def extract_paper_info(text):
     """Extract paper references from XML-like tags in text"""
-    paper_pattern = r'<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>'
-    papers = re.findall(paper_pattern, text)
+    papers = _RE_PAPER.findall(text)
     return papers
 
 
 def convert_inline_citations(text):
     """Convert inline <Paper> tags to markdown citation format"""
-    # Pattern to match Paper tags with attributes
-    pattern = r'<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>'
-
-    # Replace with markdown citation format
-    def replace_citation(match):
-        paper_title = match.group(1)
-        # Extract just the author-year from the title like "(Author et al., 2024)"
-        return f"{paper_title}"
-
-    return re.sub(pattern, replace_citation, text)
+    # Keep just the author-year title like "(Author et al., 2024)"
+    return _RE_PAPER.sub(r'\1', text)
 
 
 def convert_model_tags(text):
     """Remove Model tags that represent AI-generated content markers"""
-    pattern = r'<Model[^>]*>\.?</Model>'
-    return re.sub(pattern, '', text)
+    return _RE_MODEL.sub('', text)
 
 
-def build_references_section(sections):
-    """Build a comprehensive references section from all citations"""
+def convert_section_text(text):
+    """
+    Remove Model tags and convert inline <Paper> tags in a single pass
+
+    Equivalent to convert_inline_citations(convert_model_tags(text)).
+    """
+    return _RE_TAGS.sub(r'\1', text)
+
+
+def _clean_section_texts(texts):
+    """
+    Return an iterator of convert_section_text over texts, in order
+
+    Small reports are cleaned lazily, one section at a time as the caller
+    consumes them. Large reports are cleaned up front in a process pool;
+    on platforms that spawn workers (Windows, macOS) this re-imports the
+    caller's main module, so scripts that convert large reports must guard
+    their entry point with ``if __name__ == '__main__':``.
+    """
+    if (len(texts) > PARALLEL_MIN_SECTIONS
+            and (os.cpu_count() or 1) > 1
+            and sum(map(len, texts)) >= PARALLEL_MIN_CHARS):
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Sections are independent; map preserves their order
+        with ProcessPoolExecutor() as executor:
+            return iter(list(executor.map(convert_section_text, texts)))
+
+    return map(convert_section_text, texts)
+
+
+def _iter_references_section(sections):
+    """Yield the references section for all citations piece by piece"""
     all_citations = {}
 
     for section in sections:
-        citations = section.get('citations', [])
-        for citation in citations:
+        for citation in section.get('citations', []):
             citation_id = citation.get('id', '')
-            if citation_id and citation_id not in all_citations:
-                all_citations[citation_id] = citation
+            if citation_id:
+                # First occurrence wins
+                all_citations.setdefault(citation_id, citation)
 
     if not all_citations:
-        return ""
+        return
 
-    md_content = "\n## References\n\n"
+    yield "\n## References\n\n"
 
-    for citation_id in sorted(all_citations.keys()):
-        citation = all_citations[citation_id]
+    for citation_id, citation in sorted(all_citations.items()):
         paper = citation.get('paper', {})
 
         title = paper.get('title', 'Unknown Title')
@@ -64,99 +105,120 @@ def build_references_section(sections):
         author_str = ', '.join(author_names) if author_names else 'Unknown Authors'
 
         # Format reference entry
-        md_content += f"### {citation_id}\n\n"
-        md_content += f"{author_str} ({year}). *{title}*"
+        yield f"### {citation_id}\n\n"
+        yield f"{author_str} ({year}). *{title}*"
 
         if venue:
-            md_content += f". {venue}"
-        md_content += ".\n\n"
+            yield f". {venue}"
+        yield ".\n\n"
 
         if corpus_id:
-            md_content += f"- **Corpus ID:** {corpus_id}\n"
+            yield f"- **Corpus ID:** {corpus_id}\n"
         if n_citations:
-            md_content += f"- **Citations:** {n_citations}\n"
+            yield f"- **Citations:** {n_citations}\n"
 
         # Add key snippets if available
         snippets = citation.get('snippets', [])
         if snippets:
-            md_content += "\n**Key Excerpts:**\n\n"
+            yield "\n**Key Excerpts:**\n\n"
             for i, snippet in enumerate(snippets, 1):
                 # Limit snippet length for readability
-                if len(snippet) > 500:
-                    snippet = snippet[:500] + "..."
-                md_content += f"{i}. {snippet}\n\n"
-
-        md_content += "---\n\n"
+                if len(snippet) > SNIPPET_MAX:
+                    yield f"{i}. {snippet[:SNIPPET_MAX]}...\n\n"
+                else:
+                    yield f"{i}. {snippet}\n\n"
 
-    return md_content
+        yield "---\n\n"
 
 
-def convert_json_to_markdown(json_file_path):
-    """
-    Convert JSON artifact to markdown with inline citations and references
+def build_references_section(sections):
+    """Build a comprehensive references section from all citations"""
+    return "".join(_iter_references_section(sections))
 
-    Args:
-        json_file_path: Path to ASTRA JSON file
 
-    Returns:
-        Tuple of (markdown_content, output_md_path)
-    """
+def get_markdown_path(json_file_path):
+    """Return the .md output path for an ASTRA JSON file"""
+    base_name = os.path.splitext(json_file_path)[0]
+    return f"{base_name}.md"
 
-    # Read JSON file
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
 
+def _iter_markdown(data, json_file_path):
+    """Yield the markdown document for parsed ASTRA JSON piece by piece"""
     # Extract title from query or use default
     query = data.get('query', '')
     report_type = data.get('type', 'Report')
 
     # Start building markdown content with YAML front matter
-    md_content = "---\n"
-    md_content += f"title: \"ASTRA {report_type}: {query if query else 'Research Report'}\"\n"
-    md_content += "format: pdf\n"
-    md_content += "---\n\n"
+    yield "---\n"
+    yield f"title: \"ASTRA {report_type}: {query if query else 'Research Report'}\"\n"
+    yield "format: pdf\n"
+    yield "---\n\n"
 
     # Add metadata
-    md_content += f"**Report ID:** {data.get('id', 'Unknown')}\n\n"
+    yield f"**Report ID:** {data.get('id', 'Unknown')}\n\n"
 
     filename_parts = os.path.basename(json_file_path).split('-')
     if len(filename_parts) >= 3:
         date_str = f"{filename_parts[0]}-{filename_parts[1]}-{filename_parts[2]}"
-        md_content += f"**Generated:** {date_str}\n\n"
+        yield f"**Generated:** {date_str}\n\n"
 
     if query:
-        md_content += f"**Research Question:** {query}\n\n"
+        yield f"**Research Question:** {query}\n\n"
 
-    md_content += "---\n\n"
+    yield "---\n\n"
 
-    # Process sections
+    # Process sections; texts are cleaned as each section is written
     sections = data.get('sections', [])
+    # Missing or null texts are cleaned as '' and skipped below
+    clean_texts = _clean_section_texts([section.get('text') or '' for section in sections])
 
-    for section in sections:
+    for section, clean_text in zip(sections, clean_texts):
         section_title = section.get('title', 'Untitled Section')
         tldr = section.get('tldr', '')
         text = section.get('text', '')
 
         # Add section header
-        md_content += f"## {section_title}\n\n"
+        yield f"## {section_title}\n\n"
 
         # Add TLDR if available
         if tldr:
-            md_content += f"**TL;DR:** {tldr}\n\n"
+            yield f"**TL;DR:** {tldr}\n\n"
 
         # Add main text with inline citations
         if text:
-            # First remove Model tags
-            clean_text = convert_model_tags(text)
-            # Then convert inline citations
-            clean_text = convert_inline_citations(clean_text)
-            md_content += f"{clean_text}\n\n"
+            yield f"{clean_text}\n\n"
 
     # Add comprehensive references section at the end
-    md_content += build_references_section(sections)
+    yield from _iter_references_section(sections)
 
-    # Generate output filename
-    base_name = os.path.splitext(json_file_path)[0]
-    markdown_file = f"{base_name}.md"
 
-    return md_content, markdown_file
+def convert_json_to_markdown(json_file_path, out=None):
+    """
+    Convert JSON artifact to markdown with inline citations and references
+
+    Very large reports are cleaned in a process pool. On platforms that
+    spawn workers (Windows, macOS), call this from behind an
+    ``if __name__ == '__main__':`` guard.
+
+    Args:
+        json_file_path: Path to ASTRA JSON file
+        out: Optional writable text file. When given, the markdown is written
+            to it as it is generated rather than returned
+
+    Returns:
+        Tuple of (markdown_content, output_md_path); markdown_content is None
+        when out is given
+    """
+
+    # Read JSON file
+    with open(json_file_path, 'rb') as f:
+        data = _loads(f.read())
+
+    markdown_file = get_markdown_path(json_file_path)
+    chunks = _iter_markdown(data, json_file_path)
+
+    if out is not None:
+        out.writelines(chunks)
+        return None, markdown_file
+
+    return "".join(chunks), markdown_file
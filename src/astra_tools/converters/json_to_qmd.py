@@ -1,22 +1,49 @@
 """
 Convert JSON artifact to Quarto markdown (.qmd) format with proper bibliography citations
 """
-import json
+import filecmp
+import functools
 import os
 import re
-import glob
-import shutil
+import sys
 from pathlib import Path
 try:
-    from importlib.resources import files
+    # Optional faster JSON parser
+    from orjson import loads as _loads
 except ImportError:
-    # Fallback for Python < 3.9
-    from importlib_resources import files
-
-
+    from json import loads as _loads
+
+
+# Precompiled patterns for section text and .bib parsing
+_RE_PAPER = re.compile(r'<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>')
+# Model tags with content, or bare/self-closing ones; the shared "<Model"
+# prefix lets the engine skip straight to candidate positions
+_RE_MODEL = re.compile(r'<Model(?:[^>]*>.*?</Model>|[^>]*/?>)')
+_RE_DOUBLE_WS = re.compile(r'[ \t]{2,}')
+_RE_PUNCT_WS = re.compile(r'\s+([.,;:!?])')
+# A .bib entry header with its key; the entry body runs to the next header
+_RE_BIB_HEAD = re.compile(r'@\w+\s*\{\s*(?P<key>[^,\s]+)\s*,')
+_RE_BIB_START = re.compile(r'@\w+\s*\{')
+_RE_AUTHOR = re.compile(r'author\s*=\s*[{"]([^}"]*)["}]', re.IGNORECASE)
+_RE_YEAR = re.compile(r'year\s*=\s*[{"]?(\d{4})["}]?')
+_RE_AND = re.compile(r'\s+and\s+', re.IGNORECASE)
+_RE_NONWORD = re.compile(r'[^\w]')
+# "author, year" and "author et al., year" citation forms (casefolded)
+_RE_CITE_FORM = re.compile(r'(\S+?)(?: et al\.)?, (\d{4})')
+_RE_FALLBACK_CITE = re.compile(r'(?:\()?([A-Za-z]+)(?:\s+et\s+al\.)?,?\s+(\d{4})(?:\))?')
+
+
+@functools.lru_cache(maxsize=1)
 def get_bundled_csl_file():
     """Get path to bundled APA CSL file"""
+    # importlib.resources pulls in shutil and tempfile, so it is only
+    # imported once a CSL file is actually needed
     try:
+        try:
+            from importlib.resources import files
+        except ImportError:
+            # Fallback for Python < 3.9
+            from importlib_resources import files
         # Python 3.9+
         package_files = files('astra_tools')
         csl_file = package_files / 'data' / 'apa.csl'
@@ -57,18 +84,23 @@ def copy_csl_file(target_dir, csl_file_path=None):
     csl_filename = os.path.basename(csl_file_path)
     target_path = os.path.join(target_dir, csl_filename)
 
-    # Check if file already exists and is identical
-    if os.path.exists(target_path):
-        # File exists, check if it's the same
-        try:
-            with open(csl_file_path, 'rb') as src, open(target_path, 'rb') as dst:
-                if src.read() == dst.read():
-                    # Files are identical, no need to copy
-                    return csl_filename
-        except Exception:
-            pass  # If comparison fails, proceed with copy
-
-    # Copy the CSL file
+    # Check if file already exists and is identical. Matching size and mtime
+    # (as left by a previous copy2) short-circuits without reading either
+    # file; otherwise contents are compared chunk by chunk. A missing target
+    # raises here, so no separate existence check is needed.
+    try:
+        if filecmp.cmp(csl_file_path, target_path, shallow=True):
+            # Files are identical, no need to copy
+            return csl_filename
+    except Exception:
+        pass  # Target missing or comparison failed, proceed with copy
+
+    # Copy the CSL file (shutil is only needed here, so import it lazily).
+    # copy2 already copies in-kernel where the platform allows it, and its
+    # preserved mtime lets the shallow check above skip later copies. A
+    # hardlink is deliberately not used: editing the linked file in place
+    # would rewrite the bundled style and every other report's copy.
+    import shutil
     try:
         shutil.copy2(csl_file_path, target_path)
         print(f"✅ Copied CSL file: {csl_filename}")
@@ -78,19 +110,70 @@ def copy_csl_file(target_dir, csl_file_path=None):
         return None
 
 
+@functools.lru_cache(maxsize=128)
+def _dir_listing(directory):
+    """
+    Read a directory once, cached across batch conversions
+
+    Returns:
+        Tuple of (names, bib_files): a frozenset of every entry name, and the
+        paths of candidate .bib files. Backup and regenerated (.new.bib)
+        files are left out, and hidden files are skipped as a '*.bib' glob
+        would.
+    """
+    names = set()
+    bib_files = []
+    try:
+        with os.scandir(directory or '.') as entries:
+            for entry in entries:
+                name = entry.name
+                names.add(name)
+                if (name.endswith('.bib')
+                        and not name.endswith(('.backup', '.new.bib'))
+                        and not name.startswith('.')
+                        and entry.is_file()):
+                    bib_files.append(os.path.join(directory, name))
+    except OSError:
+        pass
+    return frozenset(names), tuple(bib_files)
+
+
+def _has_file(directory, name):
+    """Check for a file via the cached listing before touching the filesystem"""
+    # The stat on a miss keeps case-insensitive filesystems working
+    return (name in _dir_listing(directory)[0]
+            or os.path.exists(os.path.join(directory, name)))
+
+
+def clear_file_caches():
+    """
+    Forget cached CSL and .bib lookups
+
+    Long-running processes should call this when files may have been added
+    or removed since the last conversion.
+    """
+    get_bundled_csl_file.cache_clear()
+    _dir_listing.cache_clear()
+
+
 def check_bib_file(json_file_path):
-    """Check if corresponding .bib file exists"""
+    """
+    Check if corresponding .bib file exists
+
+    Directory listings are cached across calls, so a .bib added or removed
+    after the first lookup in a directory is not noticed (and a removed one
+    may still be returned) until clear_file_caches() is called.
+    """
+    json_dir, json_base = os.path.split(json_file_path)
+    json_name_no_ext = os.path.splitext(json_base)[0]
+
     # Try exact match first
     bib_file = os.path.splitext(json_file_path)[0] + '.bib'
 
-    if os.path.exists(bib_file):
+    if _has_file(json_dir, json_name_no_ext + '.bib'):
         return bib_file
 
     # Try alternate naming patterns (e.g., - vs _ before extension)
-    # Extract directory and base name
-    json_dir = os.path.dirname(json_file_path)
-    json_base = os.path.basename(json_file_path)
-    json_name_no_ext = os.path.splitext(json_base)[0]
 
     # Try replacing last - with _ (common ASTRA pattern)
     if '-' in json_name_no_ext:
@@ -98,16 +181,13 @@ def check_bib_file(json_file_path):
         parts = json_name_no_ext.rsplit('-', 1)
         if len(parts) == 2:
             alt_name = parts[0] + '_' + parts[1] + '.bib'
-            alt_path = os.path.join(json_dir, alt_name)
-            if os.path.exists(alt_path):
-                return alt_path
+            if _has_file(json_dir, alt_name):
+                return os.path.join(json_dir, alt_name)
 
     # Try looking for any .bib file in the same directory
     if json_dir:
-        bib_files = glob.glob(os.path.join(json_dir, '*.bib'))
+        bib_files = _dir_listing(json_dir)[1]
         if bib_files:
-            # Filter out backup and mapping files
-            bib_files = [f for f in bib_files if not f.endswith(('.backup', '.new.bib'))]
             # If there's only one, use it
             if len(bib_files) == 1:
                 print(f"Found bibliography file: {os.path.basename(bib_files[0])}")
@@ -131,31 +211,32 @@ def check_bib_file(json_file_path):
 def extract_citation_mapping_from_bib(bib_file_path):
     """
     Extract citation keys and build mapping from JSON citation IDs to bib keys.
-    Returns: dict mapping normalized citation IDs to actual bib keys
+    Returns: dict mapping (first author last name, year) to actual bib keys,
+    with the name casefolded; see _lookup_cite_key
     """
     citation_mapping = {}
 
     try:
-        with open(bib_file_path, 'r', encoding='utf-8') as f:
+        with open(bib_file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
             content = f.read()
 
-        # Split into entries
-        entries = re.split(r'(?=@\w+\s*\{)', content)
-
-        for entry in entries:
-            if not entry.strip() or not entry.startswith('@'):
-                continue
-
-            # Extract citation key
-            key_match = re.match(r'@\w+\s*\{\s*([^,\s]+)\s*,', entry)
-            if not key_match:
-                continue
+        # Walk the entries in a single pass over the file. Each body is
+        # searched in place via pos/endpos rather than sliced out.
+        end = len(content)
+        pos = 0
+        while True:
+            entry = _RE_BIB_HEAD.search(content, pos)
+            if not entry:
+                break
+            start = entry.end()
+            next_entry = _RE_BIB_START.search(content, start)
+            pos = next_entry.start() if next_entry else end
 
-            cite_key = key_match.group(1).strip()
+            cite_key = entry.group('key').strip()
 
             # Extract author and year for matching
-            author_match = re.search(r'author\s*=\s*[{"]([^}"]*)["}]', entry, re.IGNORECASE)
-            year_match = re.search(r'year\s*=\s*[{"]?(\d{4})["}]?', entry)
+            author_match = _RE_AUTHOR.search(content, start, pos)
+            year_match = _RE_YEAR.search(content, start, pos)
 
             if not author_match or not year_match:
                 continue
@@ -164,7 +245,7 @@ def extract_citation_mapping_from_bib(bib_file_path):
             year = year_match.group(1)
 
             # Extract first author last name
-            authors = re.split(r'\s+and\s+', author_field, flags=re.IGNORECASE)
+            authors = _RE_AND.split(author_field)
             first_author_field = authors[0].strip()
 
             # Handle "Last, First" or "First Last"
@@ -175,24 +256,16 @@ def extract_citation_mapping_from_bib(bib_file_path):
                 first_author_last = parts[-1].strip() if parts else ""
 
             # Remove special characters
-            first_author_last = re.sub(r'[^\w]', '', first_author_last)
+            first_author_last = _RE_NONWORD.sub('', first_author_last)
 
             if not first_author_last:
                 continue
 
-            # Create various possible JSON citation ID formats
-            variations = [
-                f"{first_author_last}{year}",  # Yancosek2024
-                f"{first_author_last}etal{year}",  # Yancoseketal2024
-                f"({first_author_last} et al., {year})",  # (Yancosek et al., 2024)
-                f"({first_author_last}, {year})",  # (Yancosek, 2024)
-                f"{first_author_last} et al., {year}",  # Yancosek et al., 2024
-                f"{first_author_last}, {year}",  # Yancosek, 2024
-            ]
-
-            # Store all variations mapping to the actual bib key
-            for variation in variations:
-                citation_mapping[variation.lower().strip()] = cite_key
+            # Store one canonical key per entry; every JSON citation ID
+            # format is parsed back to it at lookup time. Interned parts
+            # keep the keys' string hashes cached.
+            key = (sys.intern(first_author_last.casefold()), sys.intern(year))
+            citation_mapping[key] = cite_key
 
     except Exception as e:
         print(f"Warning: Could not parse .bib file: {e}")
@@ -200,68 +273,93 @@ def extract_citation_mapping_from_bib(bib_file_path):
     return citation_mapping
 
 
-def convert_inline_citations(text, citation_mapping=None):
+def _lookup_cite_key(citation_mapping, citation):
+    """
+    Find the bib key for a casefolded, stripped citation ID
+
+    Recognized forms are "yancosek2024", "yancoseketal2024",
+    "yancosek, 2024" and "yancosek et al., 2024".
+
+    Returns:
+        The bib key, or None if the citation matches no entry
+    """
+    match = _RE_CITE_FORM.fullmatch(citation)
+    if match:
+        return citation_mapping.get(match.groups())
+
+    # Run-together forms: the year is always the last four characters
+    author, year = citation[:-4], citation[-4:]
+    cite_key = citation_mapping.get((author, year))
+    if cite_key is None and author.endswith('etal'):
+        cite_key = citation_mapping.get((author[:-4], year))
+    return cite_key
+
+
+def _fallback_cite_key(citation):
+    """Build a citation key from text that has no .bib match"""
+    # Extract author and year for a basic key
+    match = _RE_FALLBACK_CITE.match(citation)
+    if match:
+        return match.group(1) + match.group(2)
+
+    # Last resort: create safe key
+    return _RE_NONWORD.sub('', citation)
+
+
+def convert_inline_citations(text, citation_mapping=None, resolved=None):
     """
     Convert inline <Paper> tags to Quarto citation format [@key]
+
+    Pass the same dict as resolved for every section of a document (with
+    the same citation_mapping) to resolve each paperTitle only once.
     """
-    # Pattern to match Paper tags with paperTitle attribute
-    pattern = r'<Paper[^>]*paperTitle="([^"]*)"[^>]*></Paper>'
+    # Resolved citations by raw paperTitle; reports cite the same paper often
+    if resolved is None:
+        resolved = {}
 
-    def replace_citation(match):
-        paper_title = match.group(1).strip()
+    def resolve_citation(paper_title):
+        paper_title = paper_title.strip()
 
         if citation_mapping:
-            # Try to find match in mapping
-            lookup_key = paper_title.lower().strip()
-            if lookup_key in citation_mapping:
-                return f"[@{citation_mapping[lookup_key]}]"
-
-            # Try removing parentheses
-            lookup_key_no_parens = paper_title.strip('()').lower().strip()
-            if lookup_key_no_parens in citation_mapping:
-                return f"[@{citation_mapping[lookup_key_no_parens]}]"
+            # Try to find match in mapping, ignoring surrounding parentheses
+            lookup_key = paper_title.strip('()').casefold().strip()
+            cite_key = _lookup_cite_key(citation_mapping, lookup_key)
+            if cite_key is not None:
+                return f"[@{cite_key}]"
 
-        # Fallback: extract author and year for a basic key
-        match = re.match(r'(?:\()?([A-Za-z]+)(?:\s+et\s+al\.)?,?\s+(\d{4})(?:\))?', paper_title)
-        if match:
-            author = match.group(1)
-            year = match.group(2)
-            return f"[@{author}{year}]"
+        return f"[@{_fallback_cite_key(paper_title)}]"
 
-        # Last resort: create safe key
-        safe_key = re.sub(r'[^\w]', '', paper_title)
-        return f"[@{safe_key}]"
+    def replace_citation(match):
+        paper_title = match.group(1)
+        citation = resolved.get(paper_title)
+        if citation is None:
+            citation = resolved[paper_title] = resolve_citation(paper_title)
+        return citation
 
-    return re.sub(pattern, replace_citation, text)
+    return _RE_PAPER.sub(replace_citation, text)
 
 
 def convert_model_tags(text):
     """Remove Model tags that represent AI-generated content markers"""
-    # Remove Model tags (both self-closing and with content)
-    pattern = r'<Model[^>]*>.*?</Model>'
-    text = re.sub(pattern, '', text)
-
-    # Also handle self-closing tags if any
-    pattern2 = r'<Model[^>]*/?>'
-    text = re.sub(pattern2, '', text)
+    # Remove Model tags (both self-closing and with content) in one pass
+    text = _RE_MODEL.sub('', text)
 
     # Clean up any double spaces that result (but preserve newlines)
-    text = re.sub(r'[ \t]{2,}', ' ', text)
+    text = _RE_DOUBLE_WS.sub(' ', text)
 
     # Clean up space before punctuation
-    text = re.sub(r'\s+([.,;:!?])', r'\1', text)
+    text = _RE_PUNCT_WS.sub(r'\1', text)
 
     return text.strip()
 
 
 def build_bib_entries_summary(sections, citation_mapping=None):
     """Build a summary table of references cited in the document"""
+    # Collect unique citations in one pass; the first occurrence of each id wins
     all_citations = {}
-
     for section in sections:
-        citations = section.get('citations', [])
-        for citation in citations:
-            citation_id = citation.get('id', '')
+        for citation in section.get('citations', ()):
+            citation_id = citation.get('id')
             if citation_id and citation_id not in all_citations:
                 all_citations[citation_id] = citation
 
@@ -269,14 +367,14 @@ def build_bib_entries_summary(sections, citation_mapping=None):
         return ""
 
     # Build a simple table
-    md_content = "\n## References Summary\n\n"
-    md_content += "The following sources are cited in this report and detailed in the accompanying `.bib` file:\n\n"
-
-    md_content += "| Citation | Title | Year | Venue |\n"
-    md_content += "|----------|-------|------|-------|\n"
-
-    for citation_id in sorted(all_citations.keys()):
-        citation = all_citations[citation_id]
+    parts = [
+        "\n## References Summary\n\n",
+        "The following sources are cited in this report and detailed in the accompanying `.bib` file:\n\n",
+        "| Citation | Title | Year | Venue |\n",
+        "|----------|-------|------|-------|\n",
+    ]
+
+    for citation_id, citation in sorted(all_citations.items()):
         paper = citation.get('paper', {})
 
         title = paper.get('title', 'Unknown Title')
@@ -289,21 +387,21 @@ def build_bib_entries_summary(sections, citation_mapping=None):
 
         # Get actual bib key if we have mapping
         if citation_mapping:
-            lookup_key = citation_id.lower().strip()
-            cite_key = citation_mapping.get(lookup_key, citation_id)
-        else:
-            # Fallback normalization
-            match = re.match(r'(?:\()?([A-Za-z]+)(?:\s+et\s+al\.)?,?\s+(\d{4})(?:\))?', citation_id)
-            if match:
-                author = match.group(1)
-                year_val = match.group(2)
-                cite_key = f"{author}{year_val}"
+            lookup_key = citation_id.casefold().strip()
+            if lookup_key[:1] == '(' and lookup_key[-1:] == ')':
+                # Only the comma forms are matched in parentheses
+                match = _RE_CITE_FORM.fullmatch(lookup_key, 1, len(lookup_key) - 1)
+                cite_key = citation_mapping.get(match.groups()) if match else None
             else:
-                cite_key = re.sub(r'[^\w]', '', citation_id)
+                cite_key = _lookup_cite_key(citation_mapping, lookup_key)
+            if cite_key is None:
+                cite_key = citation_id
+        else:
+            cite_key = _fallback_cite_key(citation_id)
 
-        md_content += f"| `@{cite_key}` | {title} | {year} | {venue} |\n"
+        parts.append(f"| `@{cite_key}` | {title} | {year} | {venue} |\n")
 
-    return md_content
+    return "".join(parts)
 
 
 def convert_json_to_qmd(json_file_path, bib_file_path=None, csl_file_path=None):
@@ -330,16 +428,31 @@ def convert_json_to_qmd(json_file_path, bib_file_path=None, csl_file_path=None):
     if csl_filename is None:
         csl_filename = "apa.csl"  # Use default name even if copy failed
 
+    markdown_content, qmd_file = _render_qmd(json_file_path, bib_file_path, csl_filename)
+    return markdown_content, qmd_file, csl_filename
+
+
+def _render_qmd(json_file_path, bib_file_path, csl_filename):
+    """
+    Build the Quarto markdown for a JSON artifact
+
+    Returns:
+        Tuple of (markdown_content, output_qmd_path)
+    """
+    # Split the input path once; the pieces are reused below
+    json_name = os.path.basename(json_file_path)
+    base_name = os.path.splitext(json_file_path)[0]
+
     # Read JSON file
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(json_file_path, 'rb') as f:
+        data = _loads(f.read())
 
     # Extract citation mapping from .bib file if available
     citation_mapping = {}
     if bib_file_path:
         citation_mapping = extract_citation_mapping_from_bib(bib_file_path)
         print(f"Found {len(set(citation_mapping.values()))} unique citation keys in bibliography")
-        print(f"Built {len(citation_mapping)} citation mappings")
+        print(f"Indexed {len(citation_mapping)} first-author/year pairs for citation lookup")
 
     # Extract metadata
     query = data.get('query', '')
@@ -349,36 +462,37 @@ def convert_json_to_qmd(json_file_path, bib_file_path=None, csl_file_path=None):
     bib_basename = os.path.basename(bib_file_path) if bib_file_path else "references.bib"
 
     # Start building markdown content with Quarto YAML front matter
-    md_content = "---\n"
-    md_content += f'title: "ASTRA {report_type}: {query if query else "Research Report"}"\n'
-    md_content += "format:\n"
-    md_content += "  pdf:\n"
-    md_content += "    toc: true\n"
-    md_content += "    number-sections: true\n"
+    parts = ["---\n"]
+    parts.append(f'title: "ASTRA {report_type}: {query if query else "Research Report"}"\n')
+    parts.append("format:\n")
+    parts.append("  pdf:\n")
+    parts.append("    toc: true\n")
+    parts.append("    number-sections: true\n")
 
     if bib_file_path:
-        md_content += f"bibliography: {bib_basename}\n"
-        md_content += f"csl: {csl_filename}\n"
-        md_content += "link-citations: true\n"
+        parts.append(f"bibliography: {bib_basename}\n")
+        parts.append(f"csl: {csl_filename}\n")
+        parts.append("link-citations: true\n")
 
-    md_content += "---\n\n"
+    parts.append("---\n\n")
 
     # Add metadata section
-    md_content += "## Document Information\n\n"
-    md_content += f"**Report ID:** `{data.get('id', 'Unknown')}`\n\n"
+    parts.append("## Document Information\n\n")
+    parts.append(f"**Report ID:** `{data.get('id', 'Unknown')}`\n\n")
 
-    filename_parts = os.path.basename(json_file_path).split('-')
+    filename_parts = json_name.split('-')
     if len(filename_parts) >= 3:
         date_str = f"{filename_parts[0]}-{filename_parts[1]}-{filename_parts[2]}"
-        md_content += f"**Generated:** {date_str}\n\n"
+        parts.append(f"**Generated:** {date_str}\n\n")
 
     if query:
-        md_content += f"**Research Question:** {query}\n\n"
+        parts.append(f"**Research Question:** {query}\n\n")
 
-    md_content += "---\n\n"
+    parts.append("---\n\n")
 
-    # Process sections
+    # Process sections, sharing resolved citations across all of them
     sections = data.get('sections', [])
+    resolved = {}
 
     for section in sections:
         section_title = section.get('title', 'Untitled Section')
@@ -386,32 +500,85 @@ def convert_json_to_qmd(json_file_path, bib_file_path=None, csl_file_path=None):
         text = section.get('text', '')
 
         # Add section header
-        md_content += f"## {section_title}\n\n"
+        parts.append(f"## {section_title}\n\n")
 
         # Add TLDR if available
         if tldr:
-            md_content += f"::: {{.callout-note}}\n"
-            md_content += f"## TL;DR\n{tldr}\n"
-            md_content += f":::\n\n"
+            parts.append(f"::: {{.callout-note}}\n")
+            parts.append(f"## TL;DR\n{tldr}\n")
+            parts.append(f":::\n\n")
 
         # Add main text with inline citations
         if text:
             # First remove Model tags
             clean_text = convert_model_tags(text)
             # Then convert inline citations to Quarto format
-            clean_text = convert_inline_citations(clean_text, citation_mapping)
-            md_content += f"{clean_text}\n\n"
+            clean_text = convert_inline_citations(clean_text, citation_mapping, resolved)
+            parts.append(f"{clean_text}\n\n")
 
     # Add references summary table
     if bib_file_path:
-        md_content += build_bib_entries_summary(sections, citation_mapping)
-        md_content += "\n## References\n\n"
-        md_content += "::: {#refs}\n:::\n"
+        parts.append(build_bib_entries_summary(sections, citation_mapping))
+        parts.append("\n## References\n\n")
+        parts.append("::: {#refs}\n:::\n")
     else:
-        md_content += "\n**Note:** Bibliography file not found. Citations may not render correctly.\n"
+        parts.append("\n**Note:** Bibliography file not found. Citations may not render correctly.\n")
 
     # Generate output filename
-    base_name = os.path.splitext(json_file_path)[0]
     qmd_file = f"{base_name}.qmd"
 
-    return md_content, qmd_file, csl_filename
+    return "".join(parts), qmd_file
+
+
+def _write_qmd(job):
+    """Render one (json, bib, csl) job and write its .qmd file"""
+    json_file_path, bib_file_path, csl_filename = job
+    markdown_content, qmd_file = _render_qmd(json_file_path, bib_file_path, csl_filename)
+
+    with open(qmd_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(markdown_content)
+
+    return qmd_file
+
+
+def convert_many(json_paths, workers=None, csl_file_path=None):
+    """
+    Convert several JSON artifacts to .qmd files, in parallel across files
+
+    Each .bib file is auto-detected and each .qmd is written next to its
+    JSON file by the worker that renders it. CSL files are copied once per
+    output directory before any worker starts, so workers never write the
+    same file. On platforms that spawn workers (Windows, macOS), call this
+    from behind an ``if __name__ == '__main__':`` guard.
+
+    Args:
+        json_paths: Paths to ASTRA JSON files
+        workers: Maximum number of worker processes, at least 1 (defaults
+            to the CPU count); 1 converts in this process
+        csl_file_path: Optional path to custom CSL file (uses bundled apa.csl if None)
+
+    Returns:
+        List of output .qmd paths, in the order of json_paths
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    csl_filenames = {}  # output directory -> CSL filename
+    jobs = []
+
+    for json_file_path in json_paths:
+        output_dir = os.path.dirname(json_file_path) or '.'
+        if output_dir not in csl_filenames:
+            csl_filenames[output_dir] = copy_csl_file(output_dir, csl_file_path) or "apa.csl"
+        jobs.append((json_file_path, check_bib_file(json_file_path), csl_filenames[output_dir]))
+
+    if len(jobs) > 1 and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Files are independent; map preserves their order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_write_qmd, jobs))
+
+    return [_write_qmd(job) for job in jobs]
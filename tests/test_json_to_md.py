@@ -0,0 +1,34 @@
+"""Tests for the JSON to markdown converter"""
+import json
+
+from astra_tools.converters.json_to_md import convert_json_to_markdown
+
+
+def write_report(tmp_path, sections):
+    json_file = tmp_path / "2024-01-02-report.json"
+    json_file.write_text(json.dumps({"id": "r1", "sections": sections}), encoding="utf-8")
+    return json_file
+
+
+def test_null_and_missing_section_text(tmp_path):
+    json_file = write_report(tmp_path, [
+        {"title": "Null", "text": None},
+        {"title": "Missing"},
+        {"title": "Cited", "text": 'See <Paper paperTitle="(Smith, 2024)"></Paper>.'},
+    ])
+
+    markdown, md_file = convert_json_to_markdown(str(json_file))
+
+    assert md_file.endswith("2024-01-02-report.md")
+    assert "## Null\n\n## Missing\n\n## Cited\n\nSee (Smith, 2024).\n\n" in markdown
+
+
+def test_streamed_output_matches_returned_content(tmp_path):
+    json_file = write_report(tmp_path, [{"title": "Only", "text": None}])
+    out_file = tmp_path / "out.md"
+
+    with open(out_file, "w", encoding="utf-8") as f:
+        content, _ = convert_json_to_markdown(str(json_file), out=f)
+
+    assert content is None
+    assert out_file.read_text(encoding="utf-8") == convert_json_to_markdown(str(json_file))[0]
@@ -0,0 +1,100 @@
+"""Tests for citation mapping and resolution in the Quarto converter"""
+import pytest
+
+from astra_tools.converters.json_to_qmd import (
+    build_bib_entries_summary,
+    check_bib_file,
+    clear_file_caches,
+    convert_inline_citations,
+    extract_citation_mapping_from_bib,
+)
+
+BIB = """@article{Yancosek2024Beacon,
+  author = {Yancosek, Kathleen and Doe, Jane},
+  title = {Beacon},
+  year = {2024}
+}
+
+@article{Smith2010Deep,
+  author = "John Smith",
+  title = "Deep",
+  year = "2010"
+}
+"""
+
+
+@pytest.fixture
+def citation_mapping(tmp_path):
+    bib_file = tmp_path / "refs.bib"
+    bib_file.write_text(BIB, encoding="utf-8")
+    return extract_citation_mapping_from_bib(str(bib_file))
+
+
+def test_mapping_has_one_key_per_entry(citation_mapping):
+    assert citation_mapping == {
+        ("yancosek", "2024"): "Yancosek2024Beacon",
+        ("smith", "2010"): "Smith2010Deep",
+    }
+
+
+@pytest.mark.parametrize("paper_title, expected", [
+    ("Yancosek2024", "[@Yancosek2024Beacon]"),
+    ("Yancoseketal2024", "[@Yancosek2024Beacon]"),
+    ("(Yancosek et al., 2024)", "[@Yancosek2024Beacon]"),
+    ("(Yancosek, 2024)", "[@Yancosek2024Beacon]"),
+    ("Yancosek et al., 2024", "[@Yancosek2024Beacon]"),
+    ("Yancosek, 2024", "[@Yancosek2024Beacon]"),
+    ("YANCOSEK, 2024", "[@Yancosek2024Beacon]"),
+    ("  (smith, 2010) ", "[@Smith2010Deep]"),
+    ("((Smith, 2010))", "[@Smith2010Deep]"),
+    ("(Smith2010)", "[@Smith2010Deep]"),
+    # Unrecognized forms or no entry: fall back to author+year, then a safe key
+    ("Smith et al. 2010", "[@Smith2010]"),
+    ("Smith, 2011", "[@Smith2011]"),
+    ("Nobody, 1999", "[@Nobody1999]"),
+    ("Weird!!", "[@Weird]"),
+])
+def test_inline_citation_forms(citation_mapping, paper_title, expected):
+    text = f'See <Paper corpusId="1" paperTitle="{paper_title}"></Paper>.'
+
+    assert convert_inline_citations(text, citation_mapping) == f"See {expected}."
+
+
+@pytest.mark.parametrize("citation_id, expected", [
+    ("Yancosek2024", "Yancosek2024Beacon"),
+    ("(Yancosek et al., 2024)", "Yancosek2024Beacon"),
+    ("YANCOSEK, 2024", "Yancosek2024Beacon"),
+    ("  (smith, 2010) ", "Smith2010Deep"),
+    # Only single parentheses around the comma forms are matched here
+    ("((Smith, 2010))", "((Smith, 2010))"),
+    ("(Smith2010)", "(Smith2010)"),
+    ("Smith, 2011", "Smith, 2011"),
+])
+def test_summary_citation_forms(citation_mapping, citation_id, expected):
+    sections = [{"citations": [{"id": citation_id, "paper": {"title": "T", "year": 2020}}]}]
+
+    assert f"| `@{expected}` | T | 2020 | N/A |\n" in build_bib_entries_summary(sections, citation_mapping)
+
+
+def test_inline_citations_without_mapping():
+    text = '<Paper paperTitle="(Lee et al., 2021)"></Paper> <Paper paperTitle="(Lee et al., 2021)"></Paper>'
+
+    assert convert_inline_citations(text) == "[@Lee2021] [@Lee2021]"
+
+
+def test_check_bib_file_exact_alternate_and_missing(tmp_path):
+    clear_file_caches()
+    json_file = tmp_path / "2024-01-02-report-x.json"
+    json_file.write_text("{}", encoding="utf-8")
+
+    assert check_bib_file(str(json_file)) is None
+
+    alt_bib = tmp_path / "2024-01-02-report_x.bib"
+    alt_bib.write_text(BIB, encoding="utf-8")
+    clear_file_caches()
+    assert check_bib_file(str(json_file)) == str(alt_bib)
+
+    exact_bib = tmp_path / "2024-01-02-report-x.bib"
+    exact_bib.write_text(BIB, encoding="utf-8")
+    clear_file_caches()
+    assert check_bib_file(str(json_file)) == str(exact_bib)
@@ -0,0 +1,108 @@
+"""Behavior checks for the BibTeX scanner and key regeneration"""
+from pathlib import Path
+
+from astra_tools.bib.regenerate_keys import (
+    iter_regenerated_bib,
+    parse_bib_entry,
+    regenerate_bib_keys,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_fixture_regenerates_to_expected_output():
+    content = (FIXTURES / "report.bib").read_text(encoding="utf-8")
+    expected = (FIXTURES / "report.expected.bib").read_text(encoding="utf-8")
+
+    new_content, key_mapping = regenerate_bib_keys(content)
+
+    assert new_content == expected
+    assert len(key_mapping) == 41
+    assert key_mapping["key0"] == "Smith2010DeepNetsGraphs"
+
+
+def test_streamed_output_matches_joined_output():
+    content = (FIXTURES / "report.bib").read_text(encoding="utf-8")
+    mapping = {}
+
+    assert "".join(iter_regenerated_bib(content, mapping)) == regenerate_bib_keys(content)[0]
+    assert mapping == regenerate_bib_keys(content)[1]
+
+
+def test_nested_braces_are_read_whole():
+    entry = (
+        "@article{old1,\n"
+        "  author = {Smith, John},\n"
+        "  title = {{B}ayesian {M}odels of {Deep} Learning},\n"
+        "  year = {2020}\n"
+        "}"
+    )
+
+    parsed = parse_bib_entry(entry)
+
+    assert parsed["old_key"] == "old1"
+    assert parsed["fields"]["title"] == "{B}ayesian {M}odels of {Deep} Learning"
+    assert parsed["full_text"] == entry
+    assert regenerate_bib_keys(entry)[1] == {"old1": "Smith2020BayesianModelsDeep"}
+
+
+def test_bare_year_and_string_concatenation():
+    content = (
+        '@book{old2, author = "Doe, Jane", title = "Graph Theory Explained", year = 1999}\n'
+        '@misc{c1, author={Roe, R}, title = "Part One" # " Part Two", year={2004}}\n'
+    )
+
+    assert regenerate_bib_keys(content)[1] == {
+        "old2": "Doe1999GraphTheoryExplained",
+        "c1": "Roe2004PartOnePart",
+    }
+
+
+def test_comment_preamble_and_string_blocks_pass_through():
+    blocks = (
+        '@string{jn = "Journal"}\n'
+        '@preamble{"\\newcommand{\\x}{y}"}\n'
+        "@comment{not @article{fake, title={x}}}"
+    )
+    content = blocks + "\n@article{real, author={Lee, A}, title={Real Entry Here}, year={2001}}\n"
+
+    new_content, key_mapping = regenerate_bib_keys(content)
+
+    assert key_mapping == {"real": "Lee2001RealEntryHere"}
+    assert new_content.startswith(blocks + "\n\n")
+
+
+def test_at_sign_inside_a_value_is_not_an_entry():
+    content = "@misc{n1, author={Roe, R}, note={see @misc{inner}}, title={Email Address Parsing}, year={2003}}\n"
+
+    new_content, key_mapping = regenerate_bib_keys(content)
+
+    assert key_mapping == {"n1": "Roe2003EmailAddressParsing"}
+    assert "note={see @misc{inner}}" in new_content
+
+
+def test_malformed_entry_is_left_untouched():
+    broken = "@article{broken, title = {{{Unclosed},\n}"
+    content = (
+        "@article{good1, author={Lee, A}, title={First Good Entry}, year={2001}}\n"
+        + broken
+        + "\n@article{good2, author={Kim, B}, title={Second Good Entry}, year={2002}}\n"
+    )
+
+    new_content, key_mapping = regenerate_bib_keys(content)
+
+    # The unclosed brace does not swallow the entry after it
+    assert key_mapping == {"good1": "Lee2001FirstGoodEntry", "good2": "Kim2002SecondGoodEntry"}
+    assert "\n\n" + broken + "\n\n" in new_content
+
+
+def test_entries_on_one_line_and_duplicate_suffixes():
+    entry = "@misc{{{}, author={{Ng, A}}, title={{Alpha Beta Gamma}}, year={{2000}}}}"
+    content = "".join(entry.format(key) for key in ("a", "b", "c"))
+
+    assert regenerate_bib_keys(content)[1] == {
+        "a": "Ng2000AlphaBetaGamma",
+        "b": "Ng2000AlphaBetaGamma_1",
+        "c": "Ng2000AlphaBetaGamma_2",
+    }
+